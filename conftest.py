@@ -42,7 +42,12 @@ def pytest_addoption(parser):
 
 @pytest.fixture(scope="session")
 def event_loop():
-    loop = asyncio.get_event_loop()
+    """
+    Share a single event loop across the whole session, so that session scoped
+    async fixtures are built once and every test runs on the loop they were built on.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     yield loop
     loop.close()
 
@@ -163,11 +163,7 @@ async def get_contract(
     contract = cast(
         Web3Contract,
         WEB3.eth.contract(
-            address=(
-                to_checksum_address(f"{address:040x}")
-                if address is not None
-                else address
-            ),
+            address=(_to_checksum_address(address) if address is not None else address),
             abi=artifacts["abi"],
             bytecode=bytecode,
         ),
@@ -188,12 +184,33 @@ async def get_contract(
     except NoABIFunctionsFound:
         pass
     contract.events.parse_events = MethodType(_parse_events, contract.events)
+    contract.events.event_abis = get_event_abis(contract_app, contract_name)
+    contract.events.get_events = MethodType(_get_events, contract.events)
     contract.w3.eth.send_transaction = MethodType(
         _wrap_kakarot(fun=None, caller_eoa=caller_eoa), contract
     )
     return contract
 
 
+@functools.lru_cache()
+def get_event_abis(
+    contract_app: str, contract_name: str
+) -> Dict[str, Tuple[dict, Optional[bytes]]]:
+    """
+    Map each event signature of a contract to its ABI and its topic0, the latter
+    being None for anonymous events.
+    """
+    artifacts = get_solidity_artifacts(contract_app, contract_name)
+    event_abis = {}
+    for event_abi in artifacts["abi"]:
+        if event_abi["type"] != "event":
+            continue
+        signature = abi_to_signature(event_abi)
+        topic = None if event_abi.get("anonymous") else keccak(text=signature)
+        event_abis[signature] = (event_abi, topic)
+    return event_abis
+
+
 def get_contract_sync(*args, **kwargs) -> Web3Contract:
     return uvloop.run(get_contract(*args, **kwargs))
 
@@ -350,6 +367,15 @@ def get_deployments():
         return {}
 
 
+@functools.lru_cache(maxsize=4096)
+def _to_checksum_address(address: int) -> str:
+    """
+    Checksum an EVM address, caching the keccak for the addresses that keep
+    coming back (deployed contracts, emitters of events).
+    """
+    return to_checksum_address(f"0x{address:040x}")
+
+
 def get_log_receipts(tx_receipt):
     if WEB3.is_connected():
         return tx_receipt.logs
@@ -362,7 +388,7 @@ def get_log_receipts(tx_receipt):
     ]
     return [
         LogReceipt(
-            address=to_checksum_address(f"0x{event.keys[0]:040x}"),
+            address=_to_checksum_address(event.keys[0]),
             blockHash=bytes(),
             blockNumber=bytes(),
             data=bytes(event.data),
@@ -397,6 +423,22 @@ def _parse_events(cls: ContractEvents, tx_receipt):
     }
 
 
+def _get_events(cls: ContractEvents, tx_receipt, signature: str) -> List[dict]:
+    """
+    Decode only the logs of the given event signature, filtering them on their
+    topic0 first unless the event is anonymous.
+    """
+    event_abi, topic = cls.event_abis[signature]
+    log_receipts = get_log_receipts(tx_receipt)
+    if topic is not None:
+        log_receipts = [
+            log_receipt
+            for log_receipt in log_receipts
+            if log_receipt["topics"][:1] == [topic]
+        ]
+    return _get_matching_logs_for_event(event_abi, log_receipts)
+
+
 def _get_matching_logs_for_event(event_abi, log_receipts) -> List[dict]:
     logs = []
     for log_receipt in log_receipts:
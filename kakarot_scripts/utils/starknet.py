@@ -9,6 +9,7 @@ from collections import defaultdict, namedtuple
 from copy import deepcopy
 from datetime import datetime
 from functools import cache
+from pathlib import Path
 from typing import Iterable, List, Optional, Union, cast
 
 import requests
@@ -249,14 +250,22 @@ def dump_declarations(declarations):
         open(DEPLOYMENTS_DIR / "declarations.json", "w"),
         indent=2,
     )
+    _load_declarations.cache_clear()
 
 
 def get_declarations():
+    declarations_file = DEPLOYMENTS_DIR / "declarations.json"
+    # Also keyed on the mtime in case the file is rewritten by another process
+    return dict(
+        _load_declarations(declarations_file, declarations_file.stat().st_mtime_ns)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_declarations(declarations_file: Path, _mtime: int):
     return {
         name: int(class_hash, 16)
-        for name, class_hash in json.load(
-            open(DEPLOYMENTS_DIR / "declarations.json")
-        ).items()
+        for name, class_hash in json.load(open(declarations_file)).items()
     }
 
 
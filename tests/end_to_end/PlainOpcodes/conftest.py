@@ -1,6 +1,7 @@
+import pytest
 import pytest_asyncio
 
-from kakarot_scripts.utils.kakarot import deploy
+from kakarot_scripts.utils.kakarot import deploy, get_contract
 
 
 @pytest_asyncio.fixture(scope="package")
@@ -8,6 +9,25 @@ async def counter(owner):
     return await deploy("PlainOpcodes", "Counter", caller_eoa=owner.starknet_contract)
 
 
+@pytest.fixture(scope="package")
+def counter_deployed_bytecode(counter):
+    """
+    Return the counter bytecode stripped of its constructor part.
+
+    The runtime bytecode comes from the compiler output rather than from scanning
+    the creation bytecode for the first 0xFE, which may also appear in push data.
+    """
+    return bytes(counter.bytecode_runtime)
+
+
+@pytest.fixture(scope="package")
+def counter_creation_bytecode(counter):
+    """
+    Return the ABI-encoded counter constructor call.
+    """
+    return counter.constructor().data_in_transaction
+
+
 @pytest_asyncio.fixture(scope="package")
 async def caller(owner):
     return await deploy("PlainOpcodes", "Caller", caller_eoa=owner.starknet_contract)
@@ -30,3 +50,28 @@ async def revert_on_fallbacks(owner):
         "ContractRevertOnFallbackAndReceive",
         caller_eoa=owner.starknet_contract,
     )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def contract_with_selfdestruct():
+    """
+    Return the address-less ContractWithSelfdestructMethod, used for its
+    creation bytecode and events.
+    """
+    return await get_contract("PlainOpcodes", "ContractWithSelfdestructMethod")
+
+
+@pytest.fixture(scope="session")
+def contract_with_selfdestruct_creation_bytecode(contract_with_selfdestruct):
+    """
+    Return the ABI-encoded ContractWithSelfdestructMethod constructor call.
+    """
+    return contract_with_selfdestruct.constructor().data_in_transaction
+
+
+@pytest_asyncio.fixture(scope="session")
+async def reverting_contract():
+    """
+    Return the address-less ContractRevertsOnMethodCall, used for its events.
+    """
+    return await get_contract("PlainOpcodes", "ContractRevertsOnMethodCall")
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from collections import namedtuple
 from typing import Optional, Union
 
 import pytest
 import pytest_asyncio
+import uvloop
 from eth_keys.datatypes import PrivateKey
 from starknet_py.contract import Contract
 from starknet_py.net.account.account import Account
@@ -25,6 +27,10 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# The E2E tests are bound by RPC round trips: run them on uvloop. The policy is set at
+# collection, before the session event loop of the root conftest is created.
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 Wallet = namedtuple("Wallet", ["address", "private_key", "starknet_contract"])
 
 
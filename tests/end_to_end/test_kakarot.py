@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -15,15 +16,46 @@ from kakarot_scripts.utils.starknet import (
     invoke,
     wait_for_transaction,
 )
-from tests.end_to_end.bytecodes import test_cases
 from tests.utils.constants import TRANSACTION_GAS_LIMIT
-from tests.utils.helpers import (
-    extract_memory_from_execute,
-    generate_random_evm_address,
-    hex_string_to_bytes_array,
-)
+from tests.utils.helpers import extract_memory_from_execute, generate_random_evm_address
+
+
+def _parse_params(params: dict) -> dict:
+    """
+    Add the parsed code, calldata and expected stack to the test case params.
+    """
+    return {
+        **params,
+        "code_bytes": list(bytes.fromhex(params["code"])),
+        "calldata_bytes": list(bytes.fromhex(params["calldata"])),
+        "stack_values": (
+            [item if "{" in item else int(item) for item in params["stack"].split(",")]
+            if params["stack"]
+            else []
+        ),
+    }
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize test_execute with the bytecode test cases, without mutating them.
+    """
+    if metafunc.definition.name != "test_execute":
+        return
+
+    from tests.end_to_end.bytecodes import test_cases
+
+    metafunc.parametrize(
+        "params",
+        [
+            pytest.param(
+                _parse_params(case["params"]),
+                **{key: value for key, value in case.items() if key != "params"},
+            )
+            for case in test_cases
+        ],
+    )
 
-params_execute = [pytest.param(case.pop("params"), **case) for case in test_cases]
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -57,6 +89,22 @@ def class_hashes():
     return get_declarations()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def kakarot_owner(kakarot):
+    """
+    The owner of kakarot, which the ownership tests always restore.
+    """
+    return (await kakarot.functions["get_owner"].call()).owner
+
+
+@pytest_asyncio.fixture(scope="session")
+async def eoa(new_eoa):
+    """
+    Return an EOA shared by the tests that don't change its state.
+    """
+    return await new_eoa()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def origin(evm, max_fee):
     """
@@ -67,59 +115,87 @@ async def origin(evm, max_fee):
     return evm_address
 
 
+@pytest_asyncio.fixture(scope="session")
+async def origin_starknet_address(evm, origin):
+    """
+    Return the Starknet address of the origin account.
+    """
+    return (await evm.functions["get_starknet_address"].call(origin)).contract_address
+
+
+async def _evm_execute(evm: Contract, origin: int, params: dict, max_fee: int):
+    """
+    Run the test case in a transaction and return its receipt.
+    """
+    tx = await evm.functions["evm_execute"].invoke_v1(
+        origin=origin,
+        value=int(params["value"]),
+        bytecode=params["code_bytes"],
+        calldata=params["calldata_bytes"],
+        max_fee=max_fee,
+        access_list=[],
+    )
+    status = await wait_for_transaction(tx.hash)
+    assert status == "✅"
+    return await RPC_CLIENT.get_transaction_receipt(tx.hash)
+
+
 @pytest.mark.asyncio(scope="session")
 class TestKakarot:
     class TestEVM:
-        @pytest.mark.parametrize("params", params_execute)
         async def test_execute(
-            self, eth: Contract, params: dict, evm: Contract, max_fee, origin
+            self,
+            eth: Contract,
+            params: dict,
+            evm: Contract,
+            max_fee,
+            origin,
+            origin_starknet_address,
         ):
-            result = await evm.functions["evm_call"].call(
+            evm_call = evm.functions["evm_call"].call(
                 origin=origin,
                 value=int(params["value"]),
-                bytecode=hex_string_to_bytes_array(params["code"]),
-                calldata=hex_string_to_bytes_array(params["calldata"]),
+                bytecode=params["code_bytes"],
+                calldata=params["calldata_bytes"],
                 access_list=[],
             )
-            origin_starknet_address = (
-                await evm.functions["get_starknet_address"].call(origin)
-            ).contract_address
-            self_balance = (
-                await eth.functions["balanceOf"].call(origin_starknet_address)
-            ).balance
+            events = params.get("events")
+            if events:
+                # Events only show up in a transaction, thus we run the same call, but in a tx.
+                # evm_execute doesn't commit any state, so both can run concurrently.
+                result, receipt = await asyncio.gather(
+                    evm_call, _evm_execute(evm, origin, params, max_fee)
+                )
+            else:
+                result = await evm_call
             assert result.success == params["success"]
-            assert result.stack_values[: result.stack_size] == (
-                [
-                    int(x)
-                    for x in params["stack"]
-                    .format(
-                        account_address=origin,
-                        timestamp=result.block_timestamp,
-                        block_number=result.block_number,
-                        self_balance=self_balance,
-                    )
-                    .split(",")
-                ]
-                if params["stack"]
-                else []
-            )
             assert bytes(extract_memory_from_execute(result)).hex() == params["memory"]
             assert bytes(result.return_data).hex() == params["return_data"]
 
-            events = params.get("events")
-            if events:
-                # Events only show up in a transaction, thus we run the same call, but in a tx
-                tx = await evm.functions["evm_execute"].invoke_v1(
-                    origin=origin,
-                    value=int(params["value"]),
-                    bytecode=hex_string_to_bytes_array(params["code"]),
-                    calldata=hex_string_to_bytes_array(params["calldata"]),
-                    max_fee=max_fee,
-                    access_list=[],
+            # Only a few cases check SELFBALANCE, skip the RPC for the others
+            self_balance = (
+                (await eth.functions["balanceOf"].call(origin_starknet_address)).balance
+                if "{self_balance}" in params["stack"]
+                else None
+            )
+            assert result.stack_values[: result.stack_size] == [
+                (
+                    int(
+                        value.format(
+                            account_address=origin,
+                            timestamp=result.block_timestamp,
+                            block_number=result.block_number,
+                            self_balance=self_balance,
+                        )
+                    )
+                    if isinstance(value, str)
+                    else value
                 )
-                status = await wait_for_transaction(tx.hash)
-                assert status == "✅"
-                receipt = await RPC_CLIENT.get_transaction_receipt(tx.hash)
+                for value in params["stack_values"]
+            ]
+
+            if events:
+                eth_address = eth.address
                 assert [
                     [
                         # we remove the key that is used to convey the emitting kakarot evm contract
@@ -127,7 +203,7 @@ class TestKakarot:
                         event.data,
                     ]
                     for event in receipt.events
-                    if event.from_address != eth.address
+                    if event.from_address != eth_address
                 ] == events
 
         # https://github.com/code-423n4/2024-09-kakarot-findings/issues/44
@@ -144,23 +220,21 @@ class TestKakarot:
             result = await evm.functions["evm_call"].call(
                 origin=origin,
                 value=int(params["value"]),
-                bytecode=hex_string_to_bytes_array(params["code"]),
-                calldata=hex_string_to_bytes_array(params["calldata"]),
+                bytecode=list(bytes.fromhex(params["code"])),
+                calldata=list(bytes.fromhex(params["calldata"])),
                 access_list=[],
             )
             assert result.success == params["success"]
 
     class TestGetStarknetAddress:
-        async def test_should_return_same_as_deployed_address(self, new_eoa):
-            eoa = await new_eoa()
+        async def test_should_return_same_as_deployed_address(self, eoa):
             starknet_address = await get_starknet_address(eoa.address)
             assert eoa.starknet_contract.address == starknet_address
 
     class TestDeployExternallyOwnedAccount:
         async def test_should_deploy_starknet_contract_at_corresponding_address(
-            self, new_eoa
+            self, eoa
         ):
-            eoa = await new_eoa()
             actual_evm_address = (
                 await call(
                     "account_contract",
@@ -178,8 +252,7 @@ class TestKakarot:
             assert receipt.execution_status.name == "REVERTED"
             assert "Kakarot: Caller should be" in receipt.revert_reason
 
-        async def test_should_fail_when_account_is_already_registered(self, new_eoa):
-            eoa = await new_eoa()
+        async def test_should_fail_when_account_is_already_registered(self, eoa):
             tx_hash = await invoke("kakarot", "register_account", int(eoa.address, 16))
             receipt = await RPC_CLIENT.get_transaction_receipt(tx_hash)
             assert receipt.execution_status.name == "REVERTED"
@@ -187,8 +260,7 @@ class TestKakarot:
 
     class TestSetAccountStorage:
         class TestSetAuthorizedPreEip155Tx:
-            async def test_should_fail_not_owner(self, new_eoa, other):
-                eoa = await new_eoa()
+            async def test_should_fail_not_owner(self, eoa, other):
                 tx_hash = await invoke(
                     "kakarot",
                     "set_authorized_pre_eip155_tx",
@@ -215,9 +287,7 @@ class TestKakarot:
                 == class_hashes["uninitialized_account_fixture"]
             )
 
-        async def test_should_fail_not_owner(self, new_eoa, class_hashes, other):
-            eoa = await new_eoa()
-
+        async def test_should_fail_not_owner(self, eoa, class_hashes, other):
             tx_hash = await invoke(
                 "kakarot",
                 "upgrade_account",
@@ -230,8 +300,7 @@ class TestKakarot:
             assert "Ownable: caller is not the owner" in receipt.revert_reason
 
     class TestEthCallNativeCoinTransfer:
-        async def test_eth_call_should_succeed(self, kakarot, new_eoa):
-            eoa = await new_eoa()
+        async def test_eth_call_should_succeed(self, kakarot, eoa):
             result = await kakarot.functions["eth_call"].call(
                 nonce=0,
                 origin=int(eoa.address, 16),
@@ -249,9 +318,8 @@ class TestKakarot:
 
     class TestEthCallJumpCreationCodeDeployTx:
         async def test_eth_call_jump_creation_code_deploy_tx_should_succeed(
-            self, kakarot, new_eoa
+            self, kakarot, eoa
         ):
-            eoa = await new_eoa()
             result = await kakarot.functions["eth_call"].call(
                 nonce=0,
                 origin=int(eoa.address, 16),
@@ -266,9 +334,8 @@ class TestKakarot:
             assert result.success == 1
 
         async def test_eth_call_should_handle_uninitialized_class_update(
-            self, kakarot, new_eoa, class_hashes
+            self, kakarot, eoa, class_hashes
         ):
-            eoa = await new_eoa()
             await invoke(
                 "kakarot",
                 "set_uninitialized_account_class_hash",
@@ -326,22 +393,22 @@ class TestKakarot:
             await invoke("kakarot", "upgrade", prev_class_hash)
 
     class TestTransferOwnership:
-        async def test_should_raise_when_caller_is_not_owner(self, kakarot, other):
-            prev_owner = (await kakarot.functions["get_owner"].call()).owner
+        async def test_should_raise_when_caller_is_not_owner(
+            self, kakarot, kakarot_owner, other
+        ):
             await invoke("kakarot", "transfer_ownership", other.address, account=other)
             new_owner = (await kakarot.functions["get_owner"].call()).owner
-            assert prev_owner != other.address
-            assert prev_owner == new_owner
+            assert kakarot_owner != other.address
+            assert kakarot_owner == new_owner
 
-        async def test_should_transfer_ownership(self, kakarot, other):
-            prev_owner = (await kakarot.functions["get_owner"].call()).owner
+        async def test_should_transfer_ownership(self, kakarot, kakarot_owner, other):
             await invoke("kakarot", "transfer_ownership", other.address)
             new_owner = (await kakarot.functions["get_owner"].call()).owner
 
-            assert prev_owner != new_owner
+            assert kakarot_owner != new_owner
             assert new_owner == other.address
 
-            await invoke("kakarot", "transfer_ownership", prev_owner, account=other)
+            await invoke("kakarot", "transfer_ownership", kakarot_owner, account=other)
 
     class TestAssertViewCall:
         @pytest.mark.parametrize("entrypoint", ["eth_call", "eth_estimate_gas"])
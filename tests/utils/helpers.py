@@ -76,14 +76,6 @@ def rlp_encode_signed_data(tx: dict):
         return rlp.encode(legacy_tx)
 
 
-def hex_string_to_bytes_array(h: str):
-    if len(h) % 2 != 0:
-        raise ValueError(f"Provided string has an odd length {len(h)}")
-    if h[:2] == "0x":
-        h = h[2:]
-    return [int(b, 16) for b in wrap(h, 2)]
-
-
 def extract_memory_from_execute(result):
     mem = [0] * result.memory_words_len * 32
     for i in range(0, len(result.memory_accesses), 3):
@@ -1,9 +1,10 @@
 import json
 import logging
+import os
 from functools import wraps
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Callable, List, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from starkware.cairo.lang.compiler.identifier_definition import LabelDefinition
 from starkware.cairo.lang.tracer.profile import ProfileBuilder
@@ -13,12 +14,16 @@ from tests.utils.coverage import CoverageFile
 logging.basicConfig(format="%(levelname)-8s %(message)s")
 logger = logging.getLogger("timer")
 
+# Keeping the args of every timed call alive is only worth it when a report is wanted.
+_TIME_REPORT = os.getenv("KAKAROT_TIME_REPORT") == "1"
 _time_report: List[dict] = []
 # A mapping to fix the mismatch between the debug_info and the identifiers.
 _label_scope = {
     "kakarot.constants.opcodes_label": "kakarot.constants",
     "kakarot.accounts.library.internal.pow_": "kakarot.accounts.library.internal",
 }
+# The labels of the last profiled program, as each test module compiles its own.
+_program_labels: Optional[Tuple[Any, List[Tuple[str, int]]]] = None
 T = TypeVar("T", bound=Callable[..., Any])
 
 
@@ -29,12 +34,16 @@ def timeit(fun: T) -> T:
         res = await fun(*args, **kwargs)
         stop = perf_counter()
         duration = stop - start
-        _time_report.append(
-            {"name": fun.__name__, "args": args, "kwargs": kwargs, "duration": duration}
-        )
-        logger.info(
-            f"{fun.__name__}({json.dumps(args)}, {json.dumps(kwargs)}) in {duration:.2f}s"
-        )
+        if _TIME_REPORT:
+            _time_report.append(
+                {
+                    "name": fun.__name__,
+                    "args": args,
+                    "kwargs": kwargs,
+                    "duration": duration,
+                }
+            )
+        logger.info("%s(%s, %s) in %.2fs", fun.__name__, args, kwargs, duration)
         return res
 
     return cast(T, timed_fun)
@@ -43,57 +52,91 @@ def timeit(fun: T) -> T:
 def dump_coverage(path: Union[str, Path], files: List[CoverageFile]):
     p = Path(path)
     p.mkdir(exist_ok=True, parents=True)
-    json.dump(
-        {
-            "coverage": {
-                file.name.split("__main__/")[-1]: {
-                    **{line: 0 for line in file.missed},
-                    **{line: 1 for line in file.covered},
-                }
-                for file in files
-            }
-        },
-        open(p / "coverage.json", "w"),
-        indent=2,
-    )
+    # Stream the report file by file instead of building the whole document in memory.
+    with open(p / "coverage.json", "w") as f:
+        f.write('{"coverage": {')
+        for i, file in enumerate(files):
+            lines = dict.fromkeys(file.missed, 0)
+            lines.update(dict.fromkeys(file.covered, 1))
+            name = file.name.rpartition("__main__/")[2]
+            f.write(f"{', ' if i else ''}{json.dumps(name)}: {json.dumps(lines)}")
+        f.write("}}")
+
+
+def _get_program_labels(program) -> List[Tuple[str, int]]:
+    """
+    Return the (name, pc) of all the labels of the program, cached for the last program.
+    """
+    global _program_labels
+    if _program_labels is None or _program_labels[0] is not program:
+        labels = []
+        for name, ident in program.identifiers.as_dict().items():
+            if not isinstance(ident, LabelDefinition):
+                continue
+            name = str(name)
+            labels.append((_label_scope.get(name, name), ident.pc))
+        _program_labels = (program, labels)
+    return _program_labels[1]
 
 
 def profile_from_tracer_data(tracer_data):
     """
     Un-bundle the profile.profile_from_tracer_data to hard fix the opcode_labels name mismatch
     between the debug_info and the identifiers; and adding a try/catch for the traces (pc going out of bounds).
+    Samples are built without ProfileBuilder.add_sample, caching the call stack of each frame.
     """
 
     builder = ProfileBuilder(
         initial_fp=tracer_data.trace[0].fp, memory=tracer_data.memory
     )
+    instruction_locations = tracer_data.program.debug_info.instruction_locations
+    get_pc_from_offset = tracer_data.get_pc_from_offset
+    function_id = builder.function_id
+    location_id = builder.location_id
 
     # Functions.
-    for name, ident in tracer_data.program.identifiers.as_dict().items():
-        if not isinstance(ident, LabelDefinition):
-            continue
-        builder.function_id(
-            name=_label_scope.get(str(name), str(name)),
-            inst_location=tracer_data.program.debug_info.instruction_locations[
-                ident.pc
-            ],
-        )
+    for name, pc in _get_program_labels(tracer_data.program):
+        function_id(name=name, inst_location=instruction_locations[pc])
 
     # Locations.
-    for (
-        pc_offset,
-        inst_location,
-    ) in tracer_data.program.debug_info.instruction_locations.items():
-        builder.location_id(
-            pc=tracer_data.get_pc_from_offset(pc_offset),
-            inst_location=inst_location,
-        )
+    for pc_offset, inst_location in instruction_locations.items():
+        location_id(pc=get_pc_from_offset(pc_offset), inst_location=inst_location)
 
     # Samples.
+    # Cairo memory is write-once, so the frames above a given fp never change: they are
+    # resolved once per fp instead of walking the whole call stack at every step.
+    # This mirrors ProfileBuilder.get_call_stack/add_sample of cairo-lang 0.13.2 (the locked
+    # version) and relies on its private _pc_to_location_id and _profile fields.
+    assert hasattr(builder, "_pc_to_location_id") and hasattr(
+        builder, "_profile"
+    ), "ProfileBuilder internals changed, update profile_from_tracer_data"
+    memory = tracer_data.memory
+    initial_fp = builder.initial_fp
+    pc_to_location_id = builder._pc_to_location_id
+    parent_location_ids: Dict[int, Tuple[int, ...]] = {}
+
+    def get_parent_location_ids(fp) -> Tuple[int, ...]:
+        frames = []
+        while fp > initial_fp and fp not in parent_location_ids:
+            frames.append(fp)
+            fp = memory[fp - 2]
+        location_ids = parent_location_ids.get(fp, ())
+        for frame_fp in reversed(frames):
+            location_ids = (pc_to_location_id[memory[frame_fp - 1]], *location_ids)
+            parent_location_ids[frame_fp] = location_ids
+        return location_ids
+
+    samples = builder._profile.sample
     for trace_entry in tracer_data.trace:
         try:
-            builder.add_sample(trace_entry)
+            location_ids = (
+                pc_to_location_id[trace_entry.pc],
+                *get_parent_location_ids(trace_entry.fp),
+            )
         except KeyError:
-            pass
+            continue
+        sample = samples.add()
+        sample.location_id.extend(location_ids)
+        sample.value.append(1)  # 1 step.
 
     return builder.dump()